@@ -24,55 +24,76 @@ import base64
 import hashlib
 import logging
 import math
+import mmap
 import os
-import subprocess  # nosec
 import sys
-from functools import partial
-from io import BufferedReader
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from time import time
-from typing import Any, Generator
+from time import monotonic
+from typing import Any, AsyncGenerator, Generator
 from uuid import uuid4
 
+import aiohttp
 import crypt4gh.header  # type: ignore
 import crypt4gh.keys  # type: ignore
 import crypt4gh.lib  # type: ignore
-import requests  # type: ignore
 import typer
 import yaml
-from ghga_connector.core.file_operations import read_file_parts
-from ghga_connector.core.session import RequestsSession
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from hexkit.providers.s3 import S3Config, S3ObjectStorage  # type: ignore
-from nacl.bindings import crypto_aead_chacha20poly1305_ietf_encrypt
 from pydantic import BaseSettings, Field, SecretStr
 
-
-def configure_session() -> requests.Session:
-    """Configure session with exponential backoff retry"""
-    RequestsSession.configure(6)
-    return RequestsSession.session
-
+try:
+    # prefer the libyaml C implementation when it is compiled in
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 LOGGER = logging.getLogger("s3_upload")
 LOGGER.setLevel(logging.INFO)
-PART_SIZE = 16 * 1024**2
-SESSION = configure_session()
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+MAX_CONCURRENT_DOWNLOADS = 8
+MAX_CONCURRENT_UPLOADS = 8
+NONCE_POOL_SIZE = 4096
+REQUEST_RETRIES = 6
 upload_times = []
 download_times = []
 
 
-def expand_env_vars_in_path(path: Path) -> Path:
-    """Expand environment variables in a Path."""
+def create_session() -> aiohttp.ClientSession:
+    """Configure client session with pooled, kept-alive connections"""
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=32, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector, raise_for_status=True)
+
 
-    with subprocess.Popen(  # nosec
-        f"realpath {path}", shell=True, stdout=subprocess.PIPE
-    ) as process:
-        if process.wait() != 0 or not process.stdout:
-            raise RuntimeError(f"Parsing of path failed: {path}")
+async def request_with_backoff(send_request, url: str, **kwargs) -> bytes:
+    """Send a request, retrying transient failures with exponential backoff"""
+    attempt = 0
+    while True:
+        try:
+            async with send_request(url, **kwargs) as response:
+                chunks = []
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    chunks.append(chunk)
+                return b"".join(chunks)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            # only connection issues, timeouts and server errors are worth
+            # retrying; 4xx responses like an expired presigned URL are not
+            status = getattr(error, "status", None)
+            if status is not None and status < 500:
+                raise
+            attempt += 1
+            if attempt >= REQUEST_RETRIES:
+                raise
+            await asyncio.sleep(2**attempt)
 
-        output = process.stdout.read().decode("utf-8").strip()
 
-    return Path(output)
+def expand_env_vars_in_path(path: Path) -> Path:
+    """Expand environment variables in a Path."""
+
+    return Path(os.path.expandvars(path)).expanduser().resolve(strict=False)
 
 
 class Config(BaseSettings):
@@ -96,13 +117,35 @@ class Config(BaseSettings):
     )
 
 
-class Checksums:
+class Checksums:  # pylint: disable=too-many-instance-attributes
     """Container for checksum calculation"""
 
-    def __init__(self):
-        self.unencrypted_sha256 = hashlib.sha256()
-        self.encrypted_md5: list[str] = []
-        self.encrypted_sha256: list[str] = []
+    def __init__(self, part_size: int = 0, num_parts: int = 0):
+        self.unencrypted_sha256 = hashlib.sha256(usedforsecurity=False)
+        # pre-sized and written by index when the part count is known upfront
+        self.encrypted_md5: list[str] = [""] * num_parts
+        self.encrypted_sha256: list[str] = [""] * num_parts
+        self._part_index = 0
+        # state for streamed feeding of encrypted bytes (part_size required)
+        self.part_size = part_size
+        self._current_md5 = hashlib.md5(usedforsecurity=False)
+        self._current_sha256 = hashlib.sha256(usedforsecurity=False)
+        self._current_len = 0
+
+    @property
+    def num_recorded_parts(self) -> int:
+        """Number of parts whose digests have been recorded so far"""
+        return self._part_index
+
+    def _record_part(self, md5: str, sha256: str):
+        """Store one part's digests, appending only beyond the pre-sized lists"""
+        if self._part_index < len(self.encrypted_md5):
+            self.encrypted_md5[self._part_index] = md5
+            self.encrypted_sha256[self._part_index] = sha256
+        else:
+            self.encrypted_md5.append(md5)
+            self.encrypted_sha256.append(sha256)
+        self._part_index += 1
 
     def __repr__(self) -> str:
         return (
@@ -125,67 +168,162 @@ class Checksums:
 
     def update_encrypted(self, part: bytes):
         """Update encrypted part checksums"""
-        self.encrypted_md5.append(hashlib.md5(part, usedforsecurity=False).hexdigest())
-        self.encrypted_sha256.append(hashlib.sha256(part).hexdigest())
+        self._record_part(
+            md5=hashlib.md5(part, usedforsecurity=False).hexdigest(),
+            sha256=hashlib.sha256(part, usedforsecurity=False).hexdigest(),
+        )
+
+    def feed_encrypted(self, data: bytes):
+        """
+        Stream encrypted bytes into the running part checksums, finalizing the
+        current part each time part_size bytes have been consumed.
+        """
+        if self.part_size <= 0:
+            raise ValueError(
+                "Streaming encrypted bytes requires a Checksums with a part_size"
+            )
+        while data:
+            remaining = self.part_size - self._current_len
+            chunk, data = data[:remaining], data[remaining:]
+            self._current_md5.update(chunk)
+            self._current_sha256.update(chunk)
+            self._current_len += len(chunk)
+            if self._current_len == self.part_size:
+                self.finalize_encrypted_part()
+
+    def finalize_encrypted_part(self):
+        """Record the checksums of the current part and reset the running state"""
+        if self._current_len:
+            self._record_part(
+                md5=self._current_md5.hexdigest(),
+                sha256=self._current_sha256.hexdigest(),
+            )
+            self._current_md5 = hashlib.md5(usedforsecurity=False)
+            self._current_sha256 = hashlib.sha256(usedforsecurity=False)
+            self._current_len = 0
 
 
-class ChunkedUploader:
+class ChunkedUploader:  # pylint: disable=too-many-instance-attributes
     """Handler class dealing with upload functionality"""
 
-    def __init__(
-        self, input_path: Path, config: Config, unencrypted_file_size: int
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        input_path: Path,
+        config: Config,
+        unencrypted_file_size: int,
+        session: aiohttp.ClientSession,
+        log_parts: bool = True,
     ) -> None:
         self.config = config
         self.input_path = input_path
-        self.encryptor = Encryptor(self.config.part_size)
         self.file_id = str(uuid4())
         self.unencrypted_file_size = unencrypted_file_size
-        self.encrypted_file_size = 0
 
-    async def encrypt_and_upload(self):
+        # compute encrypted_file_size
+        num_segments = math.ceil(unencrypted_file_size / crypt4gh.lib.SEGMENT_SIZE)
+        self.encrypted_file_size = unencrypted_file_size + num_segments * 28
+        self.num_parts = math.ceil(self.encrypted_file_size / self.config.part_size)
+
+        self.encryptor = Encryptor(self.config.part_size, num_parts=self.num_parts)
+        self.session = session
+        self.log_parts = log_parts
+
+    async def encrypt_and_upload(self):  # pylint: disable=too-many-locals
         """Delegate encryption and perform multipart upload"""
 
-        # compute encrypted_file_size
-        num_segments = math.ceil(self.unencrypted_file_size / crypt4gh.lib.SEGMENT_SIZE)
-        encrypted_file_size = self.unencrypted_file_size + num_segments * 28
-        num_parts = math.ceil(encrypted_file_size / self.config.part_size)
+        encrypted_file_size = self.encrypted_file_size
+        num_parts = self.num_parts
 
-        start = time()
+        start = monotonic()
+        last_completion = start
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
-        with open(self.input_path, "rb") as file:
+        with open(self.input_path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file:
+            # keep kernel readahead in front of the encryptor
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped_file.madvise(mmap.MADV_SEQUENTIAL)
             async with MultipartUpload(
                 config=self.config,
                 file_id=self.file_id,
                 encrypted_file_size=encrypted_file_size,
                 part_size=self.config.part_size,
+                session=self.session,
             ) as upload:
                 LOGGER.info("UPLOAD: Initialized file upload for %s.", upload.file_id)
-                for part_number, part in enumerate(
-                    self.encryptor.process_file(file=file), start=1
-                ):
-                    await upload.send_part(part_number=part_number, part=part)
-
-                    delta_for_part = time() - start
-                    avg_speed = (
-                        part_number
-                        * (self.config.part_size / 1024**2)
-                        / delta_for_part
-                    )
-                    LOGGER.info(
-                        "UPLOAD: Processing Part No. %i/%i (%.2f MiB/s)",
-                        part_number,
-                        num_parts,
-                        avg_speed,
-                    )
-                    upload_times.append(delta_for_part)
+
+                async def send_part(part_number: int, part: bytes):
+                    """Upload one part and release its concurrency slot"""
+                    nonlocal last_completion
+                    try:
+                        await upload.send_part(part_number=part_number, part=part)
+
+                        now = monotonic()
+                        upload_times.append(now - last_completion)
+                        last_completion = now
+                        if self.log_parts:
+                            avg_speed = (
+                                part_number
+                                * (self.config.part_size / 1024**2)
+                                / (now - start)
+                            )
+                            LOGGER.info(
+                                "UPLOAD: Processing Part No. %i/%i (%.2f MiB/s)",
+                                part_number,
+                                num_parts,
+                                avg_speed,
+                            )
+                    finally:
+                        semaphore.release()
+
+                pending: list[asyncio.Task] = []
+                part_iter = self.encryptor.process_file(file=mapped_file)
+
+                def next_part() -> bytes | None:
+                    return next(part_iter, None)
+
+                part_number = 0
+                try:
+                    while True:
+                        # encrypt off the event loop so the up to
+                        # MAX_CONCURRENT_UPLOADS in-flight parts keep moving
+                        part = await asyncio.to_thread(next_part)
+                        if part is None:
+                            break
+                        part_number += 1
+                        await semaphore.acquire()
+                        pending.append(
+                            asyncio.create_task(send_part(part_number, part))
+                        )
+                        # fail fast: surface a failed upload now instead of
+                        # producing parts for an already-aborted upload
+                        for task in [task for task in pending if task.done()]:
+                            pending.remove(task)
+                            task.result()
+
+                    await asyncio.gather(*pending)
+                finally:
+                    for task in pending:
+                        task.cancel()
+
                 if encrypted_file_size != self.encryptor.encrypted_file_size:
                     raise ValueError(
                         "Mismatch between actual and theoretical encrypted part size:\n"
                         + f"Is: {self.encryptor.encrypted_file_size}\n"
                         + f"Should be: {encrypted_file_size}"
                     )
+                # the digest lists are pre-sized, so count recorded parts
+                # rather than list length to catch a missed finalize as well
+                num_checksums = self.encryptor.checksums.num_recorded_parts
+                if num_checksums != num_parts:
+                    raise ValueError(
+                        "Mismatch between number of part checksums and parts:\n"
+                        + f"Is: {num_checksums}\n"
+                        + f"Should be: {num_parts}"
+                    )
 
-                delta = time() - start
+                delta = monotonic() - start
                 LOGGER.info(
                     "UPLOAD: Uploaded %.2f MiB in %.2f sec (encrypted size) for %s",
                     encrypted_file_size / 1024**2,
@@ -194,7 +332,7 @@ class ChunkedUploader:
                 )
 
 
-class ChunkedDownloader:
+class ChunkedDownloader:  # pylint: disable=too-many-instance-attributes
     """Handler class dealing with download functionality"""
 
     def __init__(  # pylint: disable=too-many-arguments
@@ -205,6 +343,8 @@ class ChunkedDownloader:
         file_secret: bytes,
         part_size: int,
         target_checksums: Checksums,
+        session: aiohttp.ClientSession,
+        log_parts: bool = True,
     ) -> None:
         self.config = config
         self.storage = objectstorage(self.config)
@@ -213,19 +353,40 @@ class ChunkedDownloader:
         self.file_secret = file_secret
         self.part_size = part_size
         self.target_checksums = target_checksums
+        self.session = session
+        self.log_parts = log_parts
 
-    def _download_parts(self, download_url):
-        """Download file parts"""
+    async def _download_parts(self, download_url) -> AsyncGenerator[bytes, None]:
+        """Download file parts, keeping a window of range requests in flight"""
 
-        for part_no, (start, stop) in enumerate(
-            get_ranges(file_size=self.file_size, part_size=self.config.part_size),
-            start=1,
-        ):
-            headers = {"Range": f"bytes={start}-{stop}"}
+        async def fetch_part(part_no: int, start: int, stop: int) -> bytes:
+            # encrypted parts are incompressible, skip the decompression layer
+            headers = {"Range": f"bytes={start}-{stop}", "Accept-Encoding": "identity"}
             LOGGER.debug("Downloading part number %i. %s", part_no, headers)
-            response = SESSION.get(download_url, timeout=60, headers=headers)
+            return await request_with_backoff(
+                self.session.get,
+                download_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
 
-            yield response.content
+        # parts are yielded strictly in order, while later range requests
+        # already run concurrently behind the one being consumed
+        in_flight: deque[asyncio.Task] = deque()
+        try:
+            for part_no, (start, stop) in enumerate(
+                get_ranges(file_size=self.file_size, part_size=self.config.part_size),
+                start=1,
+            ):
+                in_flight.append(asyncio.create_task(fetch_part(part_no, start, stop)))
+                if len(in_flight) >= MAX_CONCURRENT_DOWNLOADS:
+                    yield await in_flight.popleft()
+
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            for task in in_flight:
+                task.cancel()
 
     async def download(self):
         """Download file in parts and validate checksums"""
@@ -235,13 +396,16 @@ class ChunkedDownloader:
         )
         num_parts = math.ceil(self.file_size / self.part_size)
         decryptor = Decryptor(
-            file_secret=self.file_secret, num_parts=num_parts, part_size=self.part_size
+            file_secret=self.file_secret,
+            num_parts=num_parts,
+            part_size=self.part_size,
+            target_checksums=self.target_checksums,
+            log_parts=self.log_parts,
         )
-        download_func = partial(self._download_parts, download_url=download_url)
-        start = time()
-        decryptor.process_parts(download_func)
+        start = monotonic()
+        await decryptor.process_parts(self._download_parts(download_url=download_url))
 
-        delta = time() - start
+        delta = monotonic() - start
         LOGGER.info(
             "DOWNLOAD: Downloaded %.2f MiB in %.2f sec (encrypted size)",
             self.file_size / (1024**2),
@@ -261,11 +425,33 @@ class ChunkedDownloader:
 class Decryptor:
     """Handles on the fly decryption and checksum calculation"""
 
-    def __init__(self, file_secret: bytes, num_parts: int, part_size: int) -> None:
-        self.checksums = Checksums()
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        file_secret: bytes,
+        num_parts: int,
+        part_size: int,
+        target_checksums: Checksums,
+        log_parts: bool = True,
+    ) -> None:
+        self.checksums = Checksums(num_parts=num_parts)
         self.file_secret = file_secret
         self.num_parts = num_parts
         self.part_size = part_size
+        self.target_checksums = target_checksums
+        self.log_parts = log_parts
+
+    def _verify_encrypted_part(self, part_index: int):
+        """Fail fast if a freshly downloaded part does not match its upload"""
+        if (
+            self.checksums.encrypted_md5[part_index]
+            != self.target_checksums.encrypted_md5[part_index]
+            or self.checksums.encrypted_sha256[part_index]
+            != self.target_checksums.encrypted_sha256[part_index]
+        ):
+            raise ValueError(
+                f"Encrypted checksum mismatch for part no. {part_index + 1}:\n"
+                + f"Upload:\n{self.target_checksums}\nDownload:\n{self.checksums}"
+            )
 
     def _decrypt(self, part: bytes):
         """Decrypt file part"""
@@ -281,62 +467,104 @@ class Decryptor:
 
     def _decrypt_segment(self, segment: bytes):
         """Decrypt single ciphersegment"""
+        # the underlying libsodium binding only accepts proper bytes
         return crypt4gh.lib.decrypt_block(
-            ciphersegment=segment, session_keys=[self.file_secret]
+            ciphersegment=bytes(segment), session_keys=[self.file_secret]
         )
 
-    def process_parts(self, download_files: partial[Generator[bytes, None, None]]):
+    async def process_parts(self, download_parts: AsyncGenerator[bytes, None]):
         """download and decrypt file parts."""
-        unprocessed_bytes = b""
-        download_buffer = b""
-        start = time()
-
-        for part_number, file_part in enumerate(download_files()):
-            # process encrypted
-            self.checksums.update_encrypted(file_part)
-            unprocessed_bytes += file_part
-
-            # decrypt in chunks
-            decrypted_bytes, unprocessed_bytes = self._decrypt(unprocessed_bytes)
-            download_buffer += decrypted_bytes
-
-            # update checksums and yield if part size
-            if len(download_buffer) >= self.part_size:
-                current_part = download_buffer[: self.part_size]
-                self.checksums.update_unencrypted(current_part)
-                download_buffer = download_buffer[self.part_size :]
-
-            delta_for_part = time() - start
-            avg_speed = (part_number * (self.part_size / 1024**2)) / delta_for_part
-            LOGGER.info(
-                "DOWNLOAD: Downloading Part No. %i/%i (%.2f MiB/s)",
-                part_number + 1,
-                self.num_parts,
-                avg_speed,
+        unprocessed_bytes = bytearray()
+        download_buffer = bytearray()
+        start = monotonic()
+        last_completion = start
+        part_number = 0
+
+        async for file_part in download_parts:
+            # offload the CPU-bound work so the event loop keeps fetching
+            await asyncio.to_thread(
+                self._process_part,
+                file_part,
+                part_number,
+                unprocessed_bytes,
+                download_buffer,
             )
-            download_times.append(delta_for_part)
+
+            now = monotonic()
+            download_times.append(now - last_completion)
+            last_completion = now
+            part_number += 1
+            if self.log_parts:
+                avg_speed = (part_number * (self.part_size / 1024**2)) / (now - start)
+                LOGGER.info(
+                    "DOWNLOAD: Downloading Part No. %i/%i (%.2f MiB/s)",
+                    part_number,
+                    self.num_parts,
+                    avg_speed,
+                )
 
         # process dangling bytes
         if unprocessed_bytes:
-            download_buffer += self._decrypt_segment(unprocessed_bytes)
+            download_buffer.extend(self._decrypt_segment(unprocessed_bytes))
 
         while len(download_buffer) >= self.part_size:
-            current_part = download_buffer[: self.part_size]
-            self.checksums.update_unencrypted(current_part)
-            download_buffer = download_buffer[self.part_size :]
+            self._hash_part(download_buffer)
 
         if download_buffer:
             self.checksums.update_unencrypted(download_buffer)
 
-
-class Encryptor:
+    def _process_part(
+        self,
+        file_part: bytes,
+        part_number: int,
+        unprocessed_bytes: bytearray,
+        download_buffer: bytearray,
+    ):
+        """Hash, verify and decrypt one downloaded part"""
+        # process encrypted and abort before downloading any further parts
+        self.checksums.update_encrypted(file_part)
+        self._verify_encrypted_part(part_number)
+        unprocessed_bytes.extend(file_part)
+
+        # decrypt in chunks
+        decrypted_bytes, incomplete_segment = self._decrypt(unprocessed_bytes)
+        unprocessed_bytes[:] = incomplete_segment
+        download_buffer.extend(decrypted_bytes)
+
+        # update checksums if part size
+        if len(download_buffer) >= self.part_size:
+            self._hash_part(download_buffer)
+
+    def _hash_part(self, download_buffer: bytearray):
+        """Hash one part from the front of the buffer and trim it in place"""
+        view = memoryview(download_buffer)[: self.part_size]
+        self.checksums.update_unencrypted(view)
+        view.release()
+        del download_buffer[: self.part_size]
+
+
+class Encryptor:  # pylint: disable=too-many-instance-attributes
     """Handles on the fly encryption and checksum calculation"""
 
-    def __init__(self, part_size: int):
+    def __init__(self, part_size: int, num_parts: int = 0):
         self.part_size = part_size
-        self.checksums = Checksums()
+        self.checksums = Checksums(part_size=part_size, num_parts=num_parts)
         self.file_secret = os.urandom(32)
+        self.cipher = ChaCha20Poly1305(self.file_secret)
         self.encrypted_file_size = 0
+        # the AEAD backend releases the GIL, so threads encrypt in parallel
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._nonce_pool = os.urandom(12 * NONCE_POOL_SIZE)
+        self._nonce_index = 0
+
+    def _next_nonce(self) -> bytes:
+        """Take the next pooled nonce, refilling the pool when it runs dry"""
+        if self._nonce_index == NONCE_POOL_SIZE:
+            self._nonce_pool = os.urandom(12 * NONCE_POOL_SIZE)
+            self._nonce_index = 0
+        offset = self._nonce_index * 12
+        self._nonce_index += 1
+        return self._nonce_pool[offset : offset + 12]
 
     def _encrypt(self, part: bytes):
         """Encrypt file part using secret"""
@@ -344,58 +572,80 @@ class Encryptor:
             part=part, segment_size=crypt4gh.lib.SEGMENT_SIZE
         )
 
+        # nonces are drawn on this thread only, keeping the pool index safe
+        nonces = [self._next_nonce() for _ in segments]
+
         encrypted_segments = []
-        for segment in segments:
-            encrypted_segments.append(self._encrypt_segment(segment))
+        for encrypted_segment in self._executor.map(
+            self._encrypt_segment, segments, nonces
+        ):
+            # hash the ciphersegment while it is still hot in cache;
+            # map yields in order, so hashing overlaps the remaining encryption
+            self.checksums.feed_encrypted(encrypted_segment)
+            encrypted_segments.append(encrypted_segment)
 
         return b"".join(encrypted_segments), incomplete_segment
 
-    def _encrypt_segment(self, segment=bytes):
+    def _encrypt_segment(self, segment: bytes, nonce: bytes):
         """Encrypt one single segment"""
-        nonce = os.urandom(12)
-        encrypted_data = crypto_aead_chacha20poly1305_ietf_encrypt(
-            segment, None, nonce, self.file_secret
-        )  # no aad
-        return nonce + encrypted_data
-
-    # type annotation for file parts, should be generator
-    def process_file(self, file: BufferedReader):
+        # the AEAD backend only accepts proper bytes, not bytes-like buffers
+        return nonce + self.cipher.encrypt(nonce, bytes(segment), None)  # no aad
+
+    def process_file(self, file: mmap.mmap):
         """Encrypt and upload file parts."""
-        unprocessed_bytes = b""
-        upload_buffer = b""
-
-        for file_part in read_file_parts(file=file, part_size=self.part_size):
-            # process unencrypted
-            self.checksums.update_unencrypted(file_part)
-            unprocessed_bytes += file_part
-
-            # encrypt in chunks
-            encrypted_bytes, unprocessed_bytes = self._encrypt(unprocessed_bytes)
-            upload_buffer += encrypted_bytes
-
-            # update checksums and yield if part size
-            if len(upload_buffer) >= self.part_size:
-                current_part = upload_buffer[: self.part_size]
-                self.checksums.update_encrypted(current_part)
-                self.encrypted_file_size += self.part_size
-                yield current_part
-                upload_buffer = upload_buffer[self.part_size :]
+        unprocessed_bytes = bytearray()
+        upload_buffer = bytearray()
+
+        data = memoryview(file)
+        try:
+            for offset in range(0, len(data), self.part_size):
+                # process unencrypted without copying out of the page cache
+                file_part = data[offset : offset + self.part_size]
+                self.checksums.update_unencrypted(file_part)
+                unprocessed_bytes.extend(file_part)
+                file_part.release()
+
+                # encrypt in chunks
+                encrypted_bytes, incomplete_segment = self._encrypt(unprocessed_bytes)
+                unprocessed_bytes = bytearray(incomplete_segment)
+                upload_buffer.extend(encrypted_bytes)
+
+                # ciphertext outgrows plaintext by 28 B per segment, so more
+                # than one part can be ready; drain them all to keep the
+                # buffer from drifting upward over many parts
+                while len(upload_buffer) >= self.part_size:
+                    yield self._extract_part(upload_buffer)
+                    self.encrypted_file_size += self.part_size
+        finally:
+            data.release()
 
         # process dangling bytes
         if unprocessed_bytes:
-            upload_buffer += self._encrypt_segment(unprocessed_bytes)
+            encrypted_segment = self._encrypt_segment(
+                unprocessed_bytes, self._next_nonce()
+            )
+            self.checksums.feed_encrypted(encrypted_segment)
+            upload_buffer.extend(encrypted_segment)
 
         while len(upload_buffer) >= self.part_size:
-            current_part = upload_buffer[: self.part_size]
-            self.checksums.update_encrypted(current_part)
+            yield self._extract_part(upload_buffer)
             self.encrypted_file_size += self.part_size
-            yield current_part
-            upload_buffer = upload_buffer[self.part_size :]
 
         if upload_buffer:
-            self.checksums.update_encrypted(upload_buffer)
             self.encrypted_file_size += len(upload_buffer)
-            yield upload_buffer
+            yield bytes(upload_buffer)
+
+        # flush the checksums of a trailing incomplete part
+        self.checksums.finalize_encrypted_part()
+        self._executor.shutdown()
+
+    def _extract_part(self, upload_buffer: bytearray) -> bytes:
+        """Copy one part from the front of the buffer and trim it in place"""
+        view = memoryview(upload_buffer)[: self.part_size]
+        current_part = bytes(view)
+        view.release()
+        del upload_buffer[: self.part_size]
+        return current_part
 
 
 def summarize(  # pylint: disable=too-many-arguments
@@ -440,8 +690,13 @@ def summarize(  # pylint: disable=too-many-arguments
 class MultipartUpload:
     """Context manager to handle init + complete/abort for S3 multipart upload"""
 
-    def __init__(
-        self, config: Config, file_id: str, encrypted_file_size: int, part_size: int
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        config: Config,
+        file_id: str,
+        encrypted_file_size: int,
+        part_size: int,
+        session: aiohttp.ClientSession,
     ) -> None:
         self.config = config
         self.storage = objectstorage(config=self.config)
@@ -449,6 +704,7 @@ class MultipartUpload:
         self.file_size = encrypted_file_size
         self.part_size = part_size
         self.upload_id = ""
+        self.session = session
 
     async def __aenter__(self):
         """Start multipart upload"""
@@ -484,7 +740,7 @@ class MultipartUpload:
                 object_id=self.file_id,
                 part_number=part_number,
             )
-            SESSION.put(url=upload_url, data=part)
+            await request_with_backoff(self.session.put, upload_url, data=part)
         except (  # pylint: disable=broad-except
             Exception,
             KeyboardInterrupt,
@@ -498,45 +754,48 @@ class MultipartUpload:
 
 
 def objectstorage(config: Config):
-    """Configure S3 and return S3 DAO"""
-    s3_config = S3Config(
+    """Configure S3 and return S3 DAO, shared between all callers"""
+    # Config itself is not hashable, so memoize on the extracted values
+    return _objectstorage_cached(
         s3_endpoint_url=config.s3_endpoint_url.get_secret_value(),
         s3_access_key_id=config.s3_access_key_id.get_secret_value(),
         s3_secret_access_key=config.s3_secret_access_key.get_secret_value(),
     )
+
+
+@lru_cache(maxsize=4)
+def _objectstorage_cached(
+    *, s3_endpoint_url: str, s3_access_key_id: str, s3_secret_access_key: str
+):
+    """Construct the S3 DAO once per set of credentials"""
+    s3_config = S3Config(
+        s3_endpoint_url=s3_endpoint_url,
+        s3_access_key_id=s3_access_key_id,
+        s3_secret_access_key=s3_secret_access_key,
+    )
     return S3ObjectStorage(config=s3_config)
 
 
 def get_segments(part: bytes, segment_size: int):
-    """Chunk part into cipher segments"""
-    num_segments = len(part) / segment_size
-    full_segments = int(num_segments)
+    """Chunk part into cipher segment views without copying"""
+    view = memoryview(part)
+    full_segments = len(part) // segment_size
     segments = [
-        part[i * segment_size : (i + 1) * segment_size] for i in range(full_segments)
+        view[i * segment_size : (i + 1) * segment_size] for i in range(full_segments)
     ]
 
-    # check if we have a remainder of bytes that we need to handle,
+    # copy a potential remainder of bytes that we need to carry over,
     # i.e. non-matching boundaries between part and cipher segment size
-    incomplete_segment = b""
-    partial_segment_idx = math.ceil(num_segments)
-    if partial_segment_idx != full_segments:
-        incomplete_segment = part[full_segments * segment_size :]
+    incomplete_segment = bytes(view[full_segments * segment_size :])
     return segments, incomplete_segment
 
 
-def get_ranges(file_size: int, part_size: int):
-    """Calculate part ranges"""
-    num_parts = file_size / part_size
-    num_parts_floor = int(num_parts)
-
-    byte_ranges = [
-        (part_size * part_no, part_size * (part_no + 1) - 1)
-        for part_no in range(num_parts_floor)
-    ]
-    if math.ceil(num_parts) != num_parts_floor:
-        byte_ranges.append((part_size * num_parts_floor, file_size - 1))
-
-    return byte_ranges
+def get_ranges(
+    file_size: int, part_size: int
+) -> Generator[tuple[int, int], None, None]:
+    """Lazily calculate part ranges"""
+    for start in range(0, file_size, part_size):
+        yield start, min(start + part_size, file_size) - 1
 
 
 def handle_superficial_error(msg: str):
@@ -613,7 +872,7 @@ def load_config_yaml(path: Path) -> Config:
     """Load config parameters from the specified YAML file."""
 
     with open(path, "r", encoding="utf-8") as config_file:
-        config_dict = yaml.safe_load(config_file)
+        config_dict = yaml.load(config_file, Loader=SafeLoader)  # nosec
     return Config(**config_dict)
 
 
@@ -639,31 +898,38 @@ async def async_main(input_path: Path, config: Config, verbose: bool, debug: boo
     check_adjust_part_size(config=config, file_size=file_size)
 
     if not verbose:
+        # belt and braces: part-level records are not even built when disabled,
+        # but drop any that slip through other code paths as well
         LOGGER.addFilter(filter_part_logs)
 
     if debug:
         LOGGER.setLevel(logging.DEBUG)
 
-    start = time()
+    start = monotonic()
 
-    uploader = ChunkedUploader(
-        input_path=input_path,
-        config=config,
-        unencrypted_file_size=file_size,
-    )
-    await uploader.encrypt_and_upload()
-
-    downloader = ChunkedDownloader(
-        config=config,
-        file_id=uploader.file_id,
-        encrypted_file_size=uploader.encryptor.encrypted_file_size,
-        file_secret=uploader.encryptor.file_secret,
-        part_size=config.part_size,
-        target_checksums=uploader.encryptor.checksums,
-    )
-    await downloader.download()
+    async with create_session() as session:
+        uploader = ChunkedUploader(
+            input_path=input_path,
+            config=config,
+            unencrypted_file_size=file_size,
+            session=session,
+            log_parts=verbose,
+        )
+        await uploader.encrypt_and_upload()
+
+        downloader = ChunkedDownloader(
+            config=config,
+            file_id=uploader.file_id,
+            encrypted_file_size=uploader.encryptor.encrypted_file_size,
+            file_secret=uploader.encryptor.file_secret,
+            part_size=config.part_size,
+            target_checksums=uploader.encryptor.checksums,
+            session=session,
+            log_parts=verbose,
+        )
+        await downloader.download()
 
-    elapsed = time() - start
+    elapsed = monotonic() - start
 
     summarize(
         elapsed=elapsed,
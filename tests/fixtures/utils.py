@@ -14,6 +14,30 @@
 # limitations under the License.
 #
 
+from contextlib import contextmanager
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO, Generator
 
 BASE_DIR = Path(__file__).parent.resolve()
+
+MARKER_SPACING = 64 * 1024  # one marker per crypt4gh segment
+
+
+@contextmanager
+def sparse_temp_file(size: int) -> Generator[IO[bytes], None, None]:
+    """
+    Provide a mostly sparse temporary file of the given size.
+
+    A marker encoding its own offset is written at every segment boundary, so
+    content that is skipped, duplicated or reordered during processing changes
+    the file's digests; the gaps in between stay sparse on disk.
+    """
+
+    with NamedTemporaryFile() as test_file:
+        for offset in range(0, size, MARKER_SPACING):
+            test_file.seek(offset)
+            test_file.write(offset.to_bytes(8, "big"))
+        test_file.truncate(size)
+        test_file.seek(0)
+        yield test_file
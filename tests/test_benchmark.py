@@ -15,11 +15,9 @@
 
 """Test upload process"""
 
-import sys
 from pathlib import Path
 
 import pytest
-from ghga_service_commons.utils.temp_files import big_temp_file  # type: ignore
 from hexkit.providers.s3.testutils import (  # type: ignore
     config_from_localstack_container,
 )
@@ -28,6 +26,7 @@ from testcontainers.localstack import LocalStackContainer  # type: ignore
 
 from src.s3_upload_test import Config, async_main, objectstorage
 from tests.fixtures.config import config_fixture  # noqa: F401
+from tests.fixtures.utils import sparse_temp_file
 
 ALIAS = "test_file"
 TEST_FILE_SIZE = 50 * 1024**2  # 50 MiB
@@ -50,8 +49,7 @@ async def test_process(config_fixture: Config):  # noqa: F811
         )
         storage = objectstorage(config=config)
         await storage.create_bucket(bucket_id=config.bucket_id)
-        sys.set_int_max_str_digits(TEST_FILE_SIZE)
-        with big_temp_file(TEST_FILE_SIZE) as file:
+        with sparse_temp_file(TEST_FILE_SIZE) as file:
             await async_main(
                 input_path=Path(file.name),
                 config=config,